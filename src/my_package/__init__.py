@@ -1,8 +1,26 @@
 """Vibe Coding Template - A modern Python starter kit for LLM-assisted development."""
 
-__version__ = "0.1.0"
+from __future__ import annotations
 
-from my_package.core import MyPackage
-from my_package.settings import Settings
+from typing import TYPE_CHECKING, Any
+
+from my_package._version import __version__
+
+if TYPE_CHECKING:
+    from my_package.core import MyPackage
+    from my_package.settings import Settings
 
 __all__ = ["MyPackage", "Settings", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public classes on first access to keep `import my_package` cheap."""
+    if name == "MyPackage":
+        from my_package.core import MyPackage
+
+        return MyPackage
+    if name == "Settings":
+        from my_package.settings import Settings
+
+        return Settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
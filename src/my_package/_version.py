@@ -0,0 +1,3 @@
+"""Package version, kept in its own module so it can be read cheaply."""
+
+__version__ = "0.1.0"
@@ -2,15 +2,36 @@
 Simple CLI interface using Typer.
 
 This module demonstrates basic CLI patterns for modern Python applications.
+The core and settings modules are imported inside the commands that need
+them, so `--help` and `--version` stay fast.
 """
 
 from __future__ import annotations
 
-from typing import Annotated
+import os
+import sys
+from collections.abc import Iterable
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, TextIO
 
 import typer
+from typer.main import get_command_name
 
-from my_package.core import MyPackage
+from my_package._version import __version__
+
+if TYPE_CHECKING:
+    from typer.models import CommandInfo
+
+    from my_package.core import ProcessingResult
+
+# Read buffer for batch input files; larger than the 8 KiB default so big
+# files are read with fewer syscalls.
+_READ_BUFFER_SIZE = 128 * 1024
+
+# Write buffer for batch output files, so results are flushed in large
+# chunks instead of being joined into one string up front.
+_WRITE_BUFFER_SIZE = 256 * 1024
 
 # Create the Typer app
 app = typer.Typer(
@@ -22,8 +43,6 @@ app = typer.Typer(
 def version_callback(value: bool) -> None:
     """Print version information and exit."""
     if value:
-        from my_package import __version__
-
         print(f"vibe version: {__version__}")
         raise typer.Exit()
 
@@ -36,6 +55,9 @@ def main(
     ] = False,
 ) -> None:
     """Vibe Coding Template - Test-driven Python development made easy."""
+    from my_package.core import configure_logging
+
+    configure_logging()
 
 
 @app.command()
@@ -44,6 +66,8 @@ def process(
     transform: Annotated[str, typer.Option("--transform", "-t")] = "uppercase",
 ) -> None:
     """Process text with the specified transformation."""
+    from my_package.core import MyPackage
+
     try:
         package = MyPackage()
         result = package.process(text, transform)
@@ -59,19 +83,141 @@ def process(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def batch(
+    input_file: Annotated[Path, typer.Argument(help="File with one input per line")],
+    transform: Annotated[str, typer.Option("--transform", "-t")] = "uppercase",
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="Write results to this file"),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            min=1,
+            help="Spread a large batch across this many processes",
+        ),
+    ] = None,
+) -> None:
+    """Process every non-empty line of a file with the specified transformation."""
+    from my_package.core import MyPackage, validate_transform
+
+    # Reject an unknown transform once, before reading any input
+    try:
+        validate_transform(transform)
+    except ValueError as e:
+        print(f"Error: {e}")
+        raise typer.Exit(code=1) from None
+
+    package = MyPackage()
+    failed = 0
+
+    with ExitStack() as stack:
+        # Open directly instead of checking exists() first: one syscall, no race
+        try:
+            fh = stack.enter_context(
+                input_file.open("r", encoding="utf-8", buffering=_READ_BUFFER_SIZE)
+            )
+        except FileNotFoundError:
+            print(f"Error: Input file not found: {input_file}")
+            raise typer.Exit(code=1) from None
+        except OSError as e:
+            print(f"Error: Cannot read input file: {e}")
+            raise typer.Exit(code=1) from None
+
+        sink: TextIO = sys.stdout
+        if output is not None:
+            # Opening the output truncates it, which would wipe a shared input
+            if output.exists() and os.path.samefile(input_file, output):
+                print(f"Error: Output file is the same as the input file: {output}")
+                raise typer.Exit(code=1)
+            try:
+                sink = stack.enter_context(
+                    output.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE)
+                )
+            except OSError as e:
+                print(f"Error: Cannot write output file: {e}")
+                raise typer.Exit(code=1) from None
+
+        lines = (stripped for line in fh if (stripped := line.strip()))
+        results: Iterable[ProcessingResult]
+        # Lines are decoded lazily, so bad UTF-8 surfaces while iterating
+        try:
+            if workers is None:
+                results = package.batch_process_iter(lines, transform)
+            else:
+                results = package.batch_process_parallel(
+                    list(lines), transform, workers=workers
+                )
+
+            for result in results:
+                if result.success:
+                    sink.write(result.output_data)
+                    sink.write("\n")
+                else:
+                    failed += 1
+                    print(f"Error: {result.metadata.get('error', 'Unknown error')}")
+        except UnicodeDecodeError as e:
+            print(f"Error: Cannot read input file: {e}")
+            raise typer.Exit(code=1) from None
+
+    if output is not None:
+        print(f"Results written to {output}")
+    if failed:
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def info() -> None:
     """Show package information."""
+    from my_package.core import MyPackage
+
     package = MyPackage()
     stats = package.get_stats()
 
-    from my_package import __version__
-
     print("Package Information:")
     print(f"  Version: {__version__}")
     print(f"  Debug Mode: {stats['settings']['debug']}")
     print(f"  Default Transform: {stats['settings']['default_transform']}")
 
 
-if __name__ == "__main__":
+def _command_name(command: CommandInfo) -> str:
+    """Return the name Typer exposes for a registered command."""
+    if command.name:
+        return command.name
+    assert command.callback is not None
+    return get_command_name(command.callback.__name__)
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """
+    Return the subcommand requested on the command line, if any.
+
+    The first non-option argument is matched against the registered
+    commands. None means "no known subcommand" (e.g. bare `--help`), in
+    which case every command must stay registered.
+    """
+    names = {_command_name(command) for command in app.registered_commands}
+    for arg in argv[1:]:
+        if arg.startswith("-"):
+            continue
+        return arg if arg in names else None
+    return None
+
+
+def entrypoint() -> None:
+    """Console-script entry point that only builds the requested subcommand."""
+    requested = _sniff_subcommand(sys.argv)
+    if requested is not None:
+        app.registered_commands = [
+            command
+            for command in app.registered_commands
+            if _command_name(command) == requested
+        ]
     app()
+
+
+if __name__ == "__main__":
+    entrypoint()
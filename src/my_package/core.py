@@ -1,43 +1,114 @@
 """
 Core business logic and models.
 
-This module demonstrates modern Python patterns with Pydantic models
-and clean architecture for LLM-assisted development.
+This module demonstrates modern Python patterns with lightweight dataclass
+models and clean architecture for LLM-assisted development.
 """
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from my_package._version import __version__
 
-from my_package.settings import Settings
+if TYPE_CHECKING:
+    from my_package.settings import Settings
 
-# Configure basic logging
-logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
-class ProcessingRequest(BaseModel):
-    """Request model for processing operations."""
+def configure_logging(level: int | str = logging.INFO) -> None:
+    """
+    Configure root logging for command-line use.
 
-    input_data: str = Field(..., description="Input data to be processed")
-    transform_type: str = Field(
-        default="uppercase",
-        description="Type of transformation to apply",
-    )
+    Importing this module never touches global logging state; applications
+    such as the CLI call this once at startup instead.
+    """
+    logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
+
+
+def _reverse(text: str) -> str:
+    """Return the text reversed."""
+    return text[::-1]
 
 
-class ProcessingResult(BaseModel):
-    """Result model for processing operations."""
+# Supported transformations, built once instead of on every call
+_TRANSFORMS: Mapping[str, Callable[[str], str]] = {
+    "uppercase": str.upper,
+    "lowercase": str.lower,
+    "title": str.title,
+    "reverse": _reverse,
+    "capitalize": str.capitalize,
+}
+_SUPPORTED = ", ".join(_TRANSFORMS)
+
+
+def _unsupported_transform(transform_type: str) -> ValueError:
+    """Build the error raised for an unknown transformation type."""
+    return ValueError(
+        f"Unsupported transform_type: {transform_type}. Supported types: {_SUPPORTED}"
+    )
+
 
-    output_data: str = Field(..., description="Processed output data")
-    metadata: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Metadata about the processing operation",
+def _success_result(
+    input_data: str, output_data: str, transform_type: str
+) -> ProcessingResult:
+    """Build the result for a successful transformation."""
+    return ProcessingResult(
+        output_data=output_data,
+        metadata={
+            "transform_type": transform_type,
+            "input_length": len(input_data),
+            "output_length": len(output_data),
+        },
     )
-    success: bool = Field(default=True, description="Whether processing succeeded")
+
+
+def validate_transform(transform_type: str) -> None:
+    """
+    Check that a transformation type is supported.
+
+    Raises:
+        ValueError: If transform_type is not a supported transformation.
+    """
+    if transform_type not in _TRANSFORMS:
+        raise _unsupported_transform(transform_type)
+
+
+@dataclass(slots=True, frozen=True)
+class ProcessingRequest:
+    """
+    Request model for processing operations.
+
+    Attributes:
+        input_data: Input data to be processed.
+        transform_type: Type of transformation to apply.
+    """
+
+    input_data: str
+    transform_type: str = "uppercase"
+
+
+@dataclass(slots=True, frozen=True)
+class ProcessingResult:
+    """
+    Result model for processing operations.
+
+    Attributes:
+        output_data: Processed output data.
+        metadata: Metadata about the processing operation.
+        success: Whether processing succeeded.
+    """
+
+    output_data: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+    success: bool = True
 
 
 class MyPackage:
@@ -55,9 +126,22 @@ class MyPackage:
 
     def __init__(self, settings: Settings | None = None) -> None:
         """Initialize the package with optional settings."""
-        self.settings = settings or Settings()
+        if settings is None:
+            from my_package.settings import get_settings
+
+            settings = get_settings()
+        self.settings = settings
         logger.debug("MyPackage initialized")
 
+    @functools.cached_property
+    def settings_dict(self) -> Mapping[str, Any]:
+        """
+        Read-only snapshot of the settings, serialized on first access.
+
+        The snapshot is not refreshed if `settings` is modified afterwards.
+        """
+        return MappingProxyType(self.settings.model_dump())
+
     def process(
         self, input_data: str, transform_type: str = "uppercase"
     ) -> ProcessingResult:
@@ -71,60 +155,142 @@ class MyPackage:
         Returns:
             ProcessingResult containing the processed data and metadata.
         """
-        logger.info(f"Processing input with transform: {transform_type}")
-
-        request = ProcessingRequest(
-            input_data=input_data,
-            transform_type=transform_type,
-        )
+        logger.info("Processing input with transform: %s", transform_type)
 
         try:
-            result = self._apply_transformation(request)
+            result = self._apply_transformation(input_data, transform_type)
             logger.info("Processing completed successfully")
             return result
 
         except Exception as e:
-            logger.error(f"Processing failed: {e}")
+            logger.error("Processing failed: %s", e)
             return ProcessingResult(
                 output_data="",
                 success=False,
                 metadata={"error": str(e)},
             )
 
-    def _apply_transformation(self, request: ProcessingRequest) -> ProcessingResult:
+    def _apply_transformation(
+        self, input_data: str, transform_type: str
+    ) -> ProcessingResult:
         """Apply the requested transformation to the input data."""
-        transformations = {
-            "uppercase": lambda x: x.upper(),
-            "lowercase": lambda x: x.lower(),
-            "title": lambda x: x.title(),
-            "reverse": lambda x: x[::-1],
-            "capitalize": lambda x: x.capitalize(),
-        }
+        transform_func = _TRANSFORMS.get(transform_type)
+        if transform_func is None:
+            raise _unsupported_transform(transform_type)
 
-        if request.transform_type not in transformations:
-            supported = ", ".join(transformations.keys())
-            raise ValueError(
-                f"Unsupported transform_type: {request.transform_type}. "
-                f"Supported types: {supported}"
-            )
+        return _success_result(input_data, transform_func(input_data), transform_type)
+
+    def batch_process(
+        self, inputs: list[str], transform_type: str = "uppercase"
+    ) -> list[ProcessingResult]:
+        """
+        Process several inputs with the same transformation.
 
-        transform_func = transformations[request.transform_type]
-        output_data = transform_func(request.input_data)
+        The transformation is resolved once for the whole batch rather than
+        once per item.
 
-        return ProcessingResult(
-            output_data=output_data,
-            metadata={
-                "transform_type": request.transform_type,
-                "input_length": len(request.input_data),
-                "output_length": len(output_data),
-            },
+        Args:
+            inputs: Raw input strings to be processed.
+            transform_type: Type of transformation to apply to every input.
+
+        Returns:
+            One ProcessingResult per input, in the same order.
+        """
+        logger.info(
+            "Processing batch of %d with transform: %s", len(inputs), transform_type
         )
+        return list(self._iter_results(inputs, transform_type))
+
+    def batch_process_iter(
+        self, inputs: Iterable[str], transform_type: str = "uppercase"
+    ) -> Iterator[ProcessingResult]:
+        """
+        Lazily process inputs with the same transformation.
+
+        Inputs are consumed one at a time, so arbitrarily large sources
+        (such as an open file) can be processed without holding every line
+        or result in memory.
+
+        Args:
+            inputs: Raw input strings to be processed.
+            transform_type: Type of transformation to apply to every input.
+
+        Yields:
+            One ProcessingResult per input, in the same order.
+        """
+        logger.info("Processing batch with transform: %s", transform_type)
+        yield from self._iter_results(inputs, transform_type)
+
+    def batch_process_parallel(
+        self,
+        inputs: list[str],
+        transform_type: str = "uppercase",
+        workers: int | None = None,
+    ) -> list[ProcessingResult]:
+        """
+        Process a batch across a pool of worker processes.
+
+        Starting the pool costs far more than the built-in transformations,
+        so this only pays off for very large batches or expensive
+        transformations; batch_process remains the default.
+
+        Args:
+            inputs: Raw input strings to be processed.
+            transform_type: Type of transformation to apply to every input.
+            workers: Number of worker processes (defaults to the CPU count).
+
+        Returns:
+            One ProcessingResult per input, in the same order.
+        """
+        # Same start message as batch_process_iter, so `vibe batch` logs the
+        # same way with or without --workers
+        logger.info("Processing batch with transform: %s", transform_type)
+
+        transform_func = _TRANSFORMS.get(transform_type)
+        if transform_func is None or not inputs:
+            return list(self._iter_results(inputs, transform_type))
+
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(inputs) // (4 * workers))
+        logger.debug(
+            "Spreading %d inputs across %d workers (chunksize %d)",
+            len(inputs),
+            workers,
+            chunksize,
+        )
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outputs = executor.map(transform_func, inputs, chunksize=chunksize)
+            return [
+                _success_result(input_data, output_data, transform_type)
+                for input_data, output_data in zip(inputs, outputs, strict=True)
+            ]
+
+    def _iter_results(
+        self, inputs: Iterable[str], transform_type: str
+    ) -> Iterator[ProcessingResult]:
+        """Yield one result per input; shared by the batch entry points."""
+        transform_func = _TRANSFORMS.get(transform_type)
+        if transform_func is None:
+            error = str(_unsupported_transform(transform_type))
+            logger.error("Batch processing failed: %s", error)
+            for _ in inputs:
+                yield ProcessingResult(
+                    output_data="", success=False, metadata={"error": error}
+                )
+            return
+
+        for input_data in inputs:
+            yield _success_result(
+                input_data, transform_func(input_data), transform_type
+            )
 
     def get_stats(self) -> dict[str, Any]:
         """Get package statistics and information."""
-        from my_package import __version__
-
         return {
             "version": __version__,
-            "settings": self.settings.model_dump(),
+            "settings": dict(self.settings_dict),
         }
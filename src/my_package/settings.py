@@ -6,6 +6,8 @@ This module demonstrates basic configuration patterns for modern Python applicat
 
 from __future__ import annotations
 
+import functools
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -39,3 +41,14 @@ class Settings(BaseSettings):
     max_batch_size: int = Field(
         default=100, ge=1, le=1000, description="Maximum batch processing size"
     )
+
+
+@functools.cache
+def get_settings() -> Settings:
+    """
+    Return the shared settings instance.
+
+    Environment variables and the `.env` file are read on the first call
+    only; use `get_settings.cache_clear()` to force a reload.
+    """
+    return Settings()
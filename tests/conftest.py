@@ -6,12 +6,45 @@ This file provides common test fixtures for the test suite.
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
+from typer.testing import CliRunner
 
 from my_package.settings import Settings
 
+# Shared (input, transform, expected) matrix for every transformation test
+TRANSFORM_CASES = [
+    pytest.param("hello", "uppercase", "HELLO", id="up"),
+    pytest.param("HELLO", "lowercase", "hello", id="low"),
+    pytest.param("hello world", "title", "Hello World", id="title"),
+    pytest.param("hello world", "capitalize", "Hello world", id="cap"),
+    pytest.param("hello", "reverse", "olleh", id="rev"),
+]
+TRANSFORM_ARGNAMES = ("input_text", "transform_type", "expected_output")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize any test taking the transform arguments with TRANSFORM_CASES."""
+    if set(TRANSFORM_ARGNAMES) <= set(metafunc.fixturenames):
+        metafunc.parametrize(TRANSFORM_ARGNAMES, TRANSFORM_CASES)
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Provide a CLI runner shared across the test session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def hello_world_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a read-only batch input file with two lines, built once."""
+    path = tmp_path_factory.mktemp("inputs") / "hello_world.txt"
+    path.write_text("hello\nworld\n", encoding="utf-8")
+    return path
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
-    """Provide test settings with debug enabled."""
+    """Provide test settings with debug enabled; treat as read-only."""
     return Settings(debug=True, log_level="DEBUG")
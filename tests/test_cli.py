@@ -6,49 +6,232 @@ This file demonstrates basic CLI testing patterns.
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
+import pytest
+import typer
 from typer.testing import CliRunner
 
 from my_package import __version__
-from my_package.cli import app
+from my_package.cli import _sniff_subcommand, app, batch, entrypoint, info, process
+
+pytestmark = pytest.mark.cli
 
 
-class TestCLI:
-    """Test cases for CLI commands."""
+class TestCLIParsing:
+    """Test cases that exercise argument parsing through the CLI runner."""
 
-    def test_cli_help(self) -> None:
+    def test_cli_help(self, runner: CliRunner) -> None:
         """Test CLI help command."""
-        runner = CliRunner()
         result = runner.invoke(app, ["--help"])
         assert result.exit_code == 0
         assert (
             "Modern Python development made easy with TDD enforcement" in result.stdout
         )
 
-    def test_version_command(self) -> None:
+    def test_version_command(self, runner: CliRunner) -> None:
         """Test version command."""
-        runner = CliRunner()
         result = runner.invoke(app, ["--version"])
         assert result.exit_code == 0
         assert f"vibe version: {__version__}" in result.stdout
 
-    def test_process_command_basic(self) -> None:
-        """Test basic process command."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["process", "hello world"])
+    def test_process_command_transform_option(self, runner: CliRunner) -> None:
+        """Test process command parses the transform option."""
+        result = runner.invoke(app, ["process", "HELLO", "-t", "lowercase"])
         assert result.exit_code == 0
-        assert "HELLO WORLD" in result.stdout
+        assert "hello" in result.stdout
 
-    def test_process_command_with_transform(self) -> None:
-        """Test process command with transform option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["process", "HELLO", "--transform", "lowercase"])
+    @pytest.mark.parametrize(
+        "flags,expected",
+        [
+            pytest.param([], ["HELLO", "WORLD"], id="basic"),
+            pytest.param(["--transform", "title"], ["Hello", "World"], id="title"),
+            pytest.param(
+                ["--workers", "2"],
+                ["HELLO", "WORLD"],
+                id="workers",
+                marks=pytest.mark.integration,
+            ),
+        ],
+    )
+    def test_batch_variants(
+        self,
+        runner: CliRunner,
+        hello_world_file: Path,
+        flags: list[str],
+        expected: list[str],
+    ) -> None:
+        """Test batch command output for each option combination."""
+        result = runner.invoke(app, ["batch", str(hello_world_file), *flags])
         assert result.exit_code == 0
-        assert "hello" in result.stdout
+        assert result.stdout.splitlines() == expected
 
-    def test_info_command(self) -> None:
-        """Test info command."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["info"])
+    def test_batch_command_with_output(
+        self, runner: CliRunner, hello_world_file: Path, tmp_path: Path
+    ) -> None:
+        """Test batch command writes results to the output file."""
+        output_file = tmp_path / "output.txt"
+
+        result = runner.invoke(
+            app, ["batch", str(hello_world_file), "--output", str(output_file)]
+        )
         assert result.exit_code == 0
-        assert "Package Information" in result.stdout
-        assert f"Version: {__version__}" in result.stdout
+        assert "HELLO" not in result.stdout
+        assert output_file.read_text(encoding="utf-8") == "HELLO\nWORLD\n"
+
+    @pytest.mark.parametrize(
+        "output_name",
+        [
+            pytest.param("missing_dir/out.txt", id="missing-parent"),
+            pytest.param(".", id="directory"),
+        ],
+    )
+    def test_batch_command_unwritable_output(
+        self,
+        runner: CliRunner,
+        hello_world_file: Path,
+        tmp_path: Path,
+        output_name: str,
+    ) -> None:
+        """Test batch command reports an output path it cannot open."""
+        output_file = tmp_path / output_name
+
+        result = runner.invoke(
+            app, ["batch", str(hello_world_file), "--output", str(output_file)]
+        )
+        assert result.exit_code == 1
+        assert "Error: Cannot write output file" in result.stdout
+
+    def test_batch_command_output_same_as_input(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test batch command refuses to overwrite its own input file."""
+        input_file = tmp_path / "same.txt"
+        input_file.write_text("hello\nworld\n", encoding="utf-8")
+
+        result = runner.invoke(
+            app, ["batch", str(input_file), "--output", str(input_file)]
+        )
+        assert result.exit_code == 1
+        assert "Error: Output file is the same as the input file" in result.stdout
+        assert input_file.read_text(encoding="utf-8") == "hello\nworld\n"
+
+    def test_batch_command_invalid_transform(
+        self, runner: CliRunner, hello_world_file: Path
+    ) -> None:
+        """Test batch command fails on an unsupported transform."""
+        result = runner.invoke(app, ["batch", str(hello_world_file), "-t", "invalid"])
+        assert result.exit_code == 1
+        assert result.stdout.count("Unsupported transform_type") == 1
+
+    def test_batch_command_missing_file(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test batch command rejects a missing input file."""
+        result = runner.invoke(app, ["batch", str(tmp_path / "missing.txt")])
+        assert result.exit_code == 1
+        assert "Input file not found" in result.stdout
+
+    def test_batch_command_invalid_utf8(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test batch command reports undecodable input instead of crashing."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_bytes(b"hello\n\xff\xfe\n")
+
+        result = runner.invoke(app, ["batch", str(input_file)])
+        assert result.exit_code == 1
+        assert "Error: Cannot read input file" in result.stdout
+
+    def test_batch_command_directory_input(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test batch command rejects a directory as input."""
+        result = runner.invoke(app, ["batch", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "Cannot read input file" in result.stdout
+
+
+class TestCLIBehavior:
+    """Test cases that call the command functions directly."""
+
+    def test_process_command_basic(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test basic process command."""
+        process("hello world")
+        assert "HELLO WORLD" in capsys.readouterr().out
+
+    def test_process_command_with_transform(
+        self,
+        capsys: pytest.CaptureFixture[str],
+        input_text: str,
+        transform_type: str,
+        expected_output: str,
+    ) -> None:
+        """Test process command with each transform (cases from conftest.py)."""
+        process(input_text, transform_type)
+        assert capsys.readouterr().out.strip() == expected_output
+
+    def test_cli_error_handling(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test process command reports unexpected errors."""
+
+        def boom(*args: object, **kwargs: object) -> None:
+            raise Exception("Test error")
+
+        monkeypatch.setattr("my_package.core.MyPackage", boom)
+        with pytest.raises(typer.Exit) as exc_info:
+            process("hello")
+        assert exc_info.value.exit_code == 1
+        assert "Error: Test error" in capsys.readouterr().out
+
+    def test_info_command(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test info command."""
+        info()
+        out = capsys.readouterr().out
+        assert "Package Information" in out
+        assert f"Version: {__version__}" in out
+
+    def test_batch_command(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test batch command processes each non-empty line."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("hello\n\n  world  \n", encoding="utf-8")
+
+        batch(input_file)
+        assert capsys.readouterr().out.splitlines() == ["HELLO", "WORLD"]
+
+
+class TestSubcommandSniffing:
+    """Test cases for registering only the requested subcommand."""
+
+    @pytest.mark.parametrize(
+        "argv,expected",
+        [
+            (["vibe", "info"], "info"),
+            (["vibe", "process", "hello", "-t", "lowercase"], "process"),
+            (["vibe", "--version"], None),
+            (["vibe", "--help"], None),
+            (["vibe"], None),
+            (["vibe", "unknown"], None),
+        ],
+    )
+    def test_sniff_subcommand(self, argv: list[str], expected: str | None) -> None:
+        """Test picking the subcommand out of argv."""
+        assert _sniff_subcommand(argv) == expected
+
+    def test_entrypoint_registers_only_requested_command(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that the entry point drops commands that were not requested."""
+        monkeypatch.setattr(app, "registered_commands", list(app.registered_commands))
+        monkeypatch.setattr(sys, "argv", ["vibe", "process", "hello"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            entrypoint()
+
+        assert exc_info.value.code == 0
+        assert "HELLO" in capsys.readouterr().out
+        assert [command.callback for command in app.registered_commands] == [process]
@@ -6,11 +6,31 @@ This file demonstrates basic testing patterns for modern Python applications.
 
 from __future__ import annotations
 
+import logging
+import subprocess
+import sys
+from collections.abc import Iterator
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from my_package import __version__
-from my_package.core import MyPackage, ProcessingRequest, ProcessingResult
-from my_package.settings import Settings
+from my_package.core import (
+    MyPackage,
+    ProcessingRequest,
+    ProcessingResult,
+    logger,
+    validate_transform,
+)
+from my_package.settings import Settings, get_settings
+
+pytestmark = pytest.mark.core
+
+
+@pytest.fixture(scope="module")
+def package(test_settings: Settings) -> MyPackage:
+    """Provide a MyPackage instance shared by this module's read-only tests."""
+    return MyPackage(settings=test_settings)
 
 
 class TestProcessingRequest:
@@ -44,29 +64,24 @@ class TestProcessingResult:
         result = ProcessingResult(output_data="HELLO", metadata=metadata)
         assert result.metadata == metadata
 
+    def test_processing_result_is_immutable(self) -> None:
+        """Test that ProcessingResult fields cannot be reassigned."""
+        result = ProcessingResult(output_data="HELLO")
+        with pytest.raises(FrozenInstanceError):
+            result.output_data = "changed"  # type: ignore[misc]
+
 
 class TestMyPackage:
     """Test cases for MyPackage class."""
 
-    @pytest.fixture
-    def package(self) -> MyPackage:
-        """Provide MyPackage instance for testing."""
-        settings = Settings(debug=True)
-        return MyPackage(settings=settings)
-
     def test_package_initialization(self, package: MyPackage) -> None:
         """Test MyPackage initialization."""
         assert package.settings is not None
 
-    @pytest.mark.parametrize(
-        "input_text,transform_type,expected_output",
-        [
-            ("hello", "uppercase", "HELLO"),
-            ("HELLO", "lowercase", "hello"),
-            ("hello world", "title", "Hello World"),
-            ("hello", "reverse", "olleh"),
-        ],
-    )
+    def test_package_uses_shared_settings_by_default(self) -> None:
+        """Test MyPackage falls back to the cached settings instance."""
+        assert MyPackage().settings is get_settings()
+
     def test_process_transformations(
         self,
         package: MyPackage,
@@ -74,7 +89,7 @@ class TestMyPackage:
         transform_type: str,
         expected_output: str,
     ) -> None:
-        """Test various transformation types."""
+        """Test various transformation types (cases from conftest.py)."""
         result = package.process(input_text, transform_type)
         assert result.success is True
         assert result.output_data == expected_output
@@ -85,9 +100,149 @@ class TestMyPackage:
         assert result.success is False
         assert "error" in result.metadata
 
+    def test_batch_process(self, package: MyPackage) -> None:
+        """Test batch processing applies the transform to every input."""
+        results = package.batch_process(["hello", "World"], "lowercase")
+        assert [r.output_data for r in results] == ["hello", "world"]
+        assert all(r.success for r in results)
+        assert results[1].metadata == {
+            "transform_type": "lowercase",
+            "input_length": 5,
+            "output_length": 5,
+        }
+
+    def test_batch_process_matches_process(self, package: MyPackage) -> None:
+        """Test batch results match single-item processing."""
+        inputs = ["hello world", "abc"]
+        batch = package.batch_process(inputs, "reverse")
+        single = [package.process(text, "reverse") for text in inputs]
+        assert batch == single
+
+    def test_batch_process_empty(self, package: MyPackage) -> None:
+        """Test batch processing with no inputs."""
+        assert package.batch_process([]) == []
+
+    def test_batch_process_iter_is_lazy(self, package: MyPackage) -> None:
+        """Test that batch_process_iter consumes inputs on demand."""
+        consumed: list[str] = []
+
+        def inputs() -> Iterator[str]:
+            for text in ["a", "b", "c"]:
+                consumed.append(text)
+                yield text
+
+        results = package.batch_process_iter(inputs(), "uppercase")
+        assert consumed == []
+        assert next(results).output_data == "A"
+        assert consumed == ["a"]
+        assert [r.output_data for r in results] == ["B", "C"]
+
+    @pytest.mark.integration
+    def test_batch_process_parallel_matches_serial(self, package: MyPackage) -> None:
+        """Test parallel batch results match serial batch results."""
+        inputs = [f"line {i}" for i in range(20)]
+        parallel = package.batch_process_parallel(inputs, "title", workers=2)
+        assert parallel == package.batch_process(inputs, "title")
+
+    def test_batch_process_parallel_invalid_transform(self, package: MyPackage) -> None:
+        """Test parallel batch processing reports unsupported transforms."""
+        results = package.batch_process_parallel(["a"], "invalid_transform")
+        assert results[0].success is False
+
+    @pytest.mark.parametrize(
+        "inputs",
+        [
+            pytest.param([], id="empty"),
+            pytest.param(["a", "b"], id="pool", marks=pytest.mark.integration),
+        ],
+    )
+    def test_batch_paths_log_the_same_start_message(
+        self,
+        package: MyPackage,
+        caplog: pytest.LogCaptureFixture,
+        inputs: list[str],
+    ) -> None:
+        """Test serial and parallel batches log one identical INFO line."""
+        with caplog.at_level(logging.INFO, logger="my_package.core"):
+            list(package.batch_process_iter(inputs, "title"))
+            serial = [r.getMessage() for r in caplog.records]
+            caplog.clear()
+            package.batch_process_parallel(inputs, "title", workers=2)
+            parallel = [r.getMessage() for r in caplog.records]
+
+        assert serial == parallel == ["Processing batch with transform: title"]
+
+    def test_batch_process_invalid_transform(self, package: MyPackage) -> None:
+        """Test batch processing with invalid transformation type."""
+        results = package.batch_process(["a", "b"], "invalid_transform")
+        assert len(results) == 2
+        assert all(r.success is False for r in results)
+        assert "Unsupported transform_type" in results[0].metadata["error"]
+
+    def test_settings_dict_is_cached(self, package: MyPackage) -> None:
+        """Test that settings are serialized once per package."""
+        assert package.settings_dict == package.settings.model_dump()
+        assert package.settings_dict is package.settings_dict
+        with pytest.raises(TypeError):
+            package.settings_dict["debug"] = "MUTATED"  # type: ignore[index]
+
+    def test_get_stats_returns_independent_copy(self) -> None:
+        """Test that mutating one get_stats result does not leak into the next."""
+        package = MyPackage(settings=Settings(debug=True))
+        package.get_stats()["settings"]["debug"] = "MUTATED"
+        assert package.get_stats()["settings"]["debug"] is True
+
+    def test_validate_transform(self) -> None:
+        """Test transform validation accepts known types and rejects others."""
+        validate_transform("reverse")
+        with pytest.raises(ValueError, match="Unsupported transform_type"):
+            validate_transform("invalid_transform")
+
     def test_get_stats(self, package: MyPackage) -> None:
         """Test get_stats method."""
         stats = package.get_stats()
         assert "version" in stats
         assert "settings" in stats
         assert stats["version"] == __version__
+
+
+class TestLogging:
+    """Test cases for logging configuration."""
+
+    @pytest.mark.integration
+    def test_import_does_not_configure_logging(self) -> None:
+        """Test that importing core leaves the root logger untouched."""
+        code = (
+            "import logging, my_package.core; print(len(logging.getLogger().handlers))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "0"
+
+    def test_module_logger_has_null_handler(self) -> None:
+        """Test that core logs through a NullHandler when left unconfigured."""
+        assert any(isinstance(h, logging.NullHandler) for h in logger.handlers)
+
+
+class TestImports:
+    """Test cases for import-time cost of the core module."""
+
+    @pytest.mark.integration
+    def test_import_does_not_load_process_pool(self) -> None:
+        """Test that importing core leaves multiprocessing unloaded."""
+        code = (
+            "import sys, my_package.core; "
+            "print('concurrent.futures.process' in sys.modules, "
+            "'multiprocessing' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False False"
@@ -0,0 +1,47 @@
+"""
+Test suite for the package entry point.
+
+This file checks the lazy re-exports in `my_package/__init__.py`.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import my_package
+from my_package.core import MyPackage
+from my_package.settings import Settings
+
+pytestmark = pytest.mark.core
+
+
+class TestLazyExports:
+    """Test cases for lazily resolved package attributes."""
+
+    def test_public_classes_resolve(self) -> None:
+        """Test that the lazy attributes return the real classes."""
+        assert my_package.MyPackage is MyPackage
+        assert my_package.Settings is Settings
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = my_package.does_not_exist  # type: ignore[attr-defined]
+
+    @pytest.mark.integration
+    def test_import_does_not_load_core(self) -> None:
+        """Test that importing the package leaves core and pydantic unloaded."""
+        code = (
+            "import sys, my_package; "
+            "print('my_package.core' in sys.modules, 'pydantic' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False False"
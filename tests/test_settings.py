@@ -7,19 +7,34 @@ This file demonstrates basic settings testing patterns.
 from __future__ import annotations
 
 import os
-from unittest.mock import patch
+from typing import Any
 
 import pytest
 
-from my_package.settings import Settings
+from my_package.settings import Settings, get_settings
+
+pytestmark = pytest.mark.settings
+
+
+@pytest.fixture
+def env_settings(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Settings:
+    """Build Settings after applying a scenario's environment variables."""
+    for key, value in request.param["env"].items():
+        monkeypatch.setenv(key, value)
+    return Settings(**request.param.get("kwargs", {}))
 
 
 class TestSettings:
     """Test cases for Settings configuration."""
 
-    def test_default_settings(self) -> None:
-        """Test default settings values."""
-        settings = Settings()
+    def test_default_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test default settings values, ignoring the caller's environment."""
+        for key in list(os.environ):
+            if key.startswith("APP_"):
+                monkeypatch.delenv(key)
+        settings = Settings(_env_file=None)  # type: ignore[call-arg]
         assert settings.debug is False
         assert settings.log_level == "INFO"
         assert settings.default_transform == "uppercase"
@@ -38,27 +53,74 @@ class TestSettings:
         assert settings.default_transform == "lowercase"
         assert settings.max_batch_size == 50
 
-    @patch.dict(
-        os.environ,
-        {
-            "APP_DEBUG": "true",
-            "APP_LOG_LEVEL": "WARNING",
-            "APP_MAX_BATCH_SIZE": "200",
-        },
+    @pytest.mark.parametrize(
+        "env_settings,expected",
+        [
+            pytest.param(
+                {
+                    "env": {
+                        "APP_DEBUG": "true",
+                        "APP_LOG_LEVEL": "WARNING",
+                        "APP_MAX_BATCH_SIZE": "200",
+                    }
+                },
+                {"debug": True, "log_level": "WARNING", "max_batch_size": 200},
+                id="env-overrides",
+            ),
+            pytest.param(
+                {"env": {"APP_DEFAULT_TRANSFORM": "reverse"}},
+                {"default_transform": "reverse"},
+                id="default-transform",
+            ),
+            pytest.param(
+                {"env": {"APP_DEBUG": "true"}, "kwargs": {"debug": False}},
+                {"debug": False},
+                id="kwargs-win",
+            ),
+        ],
+        indirect=["env_settings"],
     )
-    def test_environment_variables(self) -> None:
+    def test_environment_variables(
+        self, env_settings: Settings, expected: dict[str, Any]
+    ) -> None:
         """Test loading settings from environment variables."""
-        settings = Settings()
-        assert settings.debug is True
-        assert settings.log_level == "WARNING"
-        assert settings.max_batch_size == 200
-
-    def test_validation(self) -> None:
-        """Test settings validation."""
-        # Test minimum constraint
-        with pytest.raises(ValueError):
-            Settings(max_batch_size=0)
-
-        # Test maximum constraint
-        with pytest.raises(ValueError):
-            Settings(max_batch_size=1001)
+        for name, value in expected.items():
+            assert getattr(env_settings, name) == value
+
+    @pytest.mark.parametrize(
+        "size,valid",
+        [
+            pytest.param(0, False, id="below-min"),
+            pytest.param(1001, False, id="above-max"),
+            pytest.param(1, True, id="min"),
+            pytest.param(1000, True, id="max"),
+        ],
+    )
+    def test_batch_size_validation(self, size: int, valid: bool) -> None:
+        """Test max_batch_size boundary validation."""
+        if valid:
+            assert Settings(max_batch_size=size).max_batch_size == size
+        else:
+            with pytest.raises(ValueError):
+                Settings(max_batch_size=size)
+
+
+class TestGetSettings:
+    """Test cases for the cached settings accessor."""
+
+    def test_get_settings_is_cached(self) -> None:
+        """Test that repeated calls return the same instance."""
+        get_settings.cache_clear()
+        assert get_settings() is get_settings()
+
+    def test_cache_clear_reloads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that clearing the cache picks up new environment values."""
+        get_settings.cache_clear()
+        first = get_settings()
+        monkeypatch.setenv("APP_MAX_BATCH_SIZE", "42")
+        get_settings.cache_clear()
+        try:
+            assert get_settings() is not first
+            assert get_settings().max_batch_size == 42
+        finally:
+            get_settings.cache_clear()